@@ -1,5 +1,9 @@
 from langchain_google_genai import ChatGoogleGenerativeAI
+import hashlib
+import io
+import json
 import os
+import sys
 
 # Define agent personalities and ideas
 agents = [
@@ -11,10 +15,17 @@ agents = [
     for i in range(16)
 ]
 
+MODEL_NAME = "gemini-2.5-flash"
+TEMPERATURE = 1.0
+
+# Identical prompts only yield interchangeable responses when sampling is
+# deterministic, so reuse them at temperature 0 or when explicitly opted in
+CACHE_RESPONSES = TEMPERATURE == 0 or os.environ.get("CACHE_LLM_RESPONSES") == "1"
+
 # Create LLM class
 llm = ChatGoogleGenerativeAI(
-    model="gemini-2.5-flash",
-    temperature=1.0,
+    model=MODEL_NAME,
+    temperature=TEMPERATURE,
     max_retries=2,
     google_api_key=os.environ.get("GOOGLE_API_KEY"),
 )
@@ -22,38 +33,83 @@ llm = ChatGoogleGenerativeAI(
 # Bind tools to the model
 model = llm.bind_tools([])
 
+# Exact-match response cache keyed on a hash of (model, temperature, prompt)
+response_cache = {}
+
+
+def _cache_key(prompt):
+    payload = json.dumps(
+        {"model": MODEL_NAME, "temperature": TEMPERATURE, "prompt": prompt},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _batch(prompts):
+    return model.batch(prompts, config={"max_concurrency": len(prompts)})
+
+
+# Send prompts concurrently, serving repeats from the cache when enabled.
+# Returns (response, from_cache) pairs in prompt order.
+def invoke_batch(prompts):
+    if not CACHE_RESPONSES:
+        return [(response, False) for response in _batch(prompts)]
+
+    keys = [_cache_key(prompt) for prompt in prompts]
+    missing = {
+        key: prompt
+        for key, prompt in zip(keys, prompts)
+        if key not in response_cache
+    }
+    fresh = set()
+    if missing:
+        response_cache.update(zip(missing, _batch(list(missing.values()))))
+        fresh.update(missing)
+
+    results = []
+    for key in keys:
+        results.append((response_cache[key], key not in fresh))
+        # Later duplicates of a freshly fetched prompt count as cache hits
+        fresh.discard(key)
+    return results
+
 
 # Simulate hackathon conversations
 def simulate_hackathon(agents, turns=5):
     token_usage = 0
     conversation_log = []
 
+    # Agent details are fixed for the whole simulation, so build prompts once
+    prompts = [
+        f"{agent['name']} with {agent['personality']} says: "
+        f"My idea is {agent['idea']}. What do you think?"
+        for agent in agents
+    ]
+
     for turn in range(1, turns + 1):
         print(f"--- Turn {turn} ---")
         turn_log = {"turn": turn, "interactions": []}
-        for agent in agents:
-            prompt = (
-                f"{agent['name']} with {agent['personality']} says: "
-                f"My idea is {agent['idea']}. What do you think?"
-            )
-            response = model.invoke(prompt)
+        # Agents are independent within a turn, so send all prompts concurrently
+        results = invoke_batch(prompts)
+        for agent, prompt, (response, from_cache) in zip(agents, prompts, results):
             print(f"{agent['name']} received response: {response}")
-            token_usage += len(prompt.split()) + response.additional_kwargs.get(
-                "usage_metadata", {}
-            ).get("total_tokens", 0)
+            if not from_cache:
+                token_usage += (response.usage_metadata or {}).get("total_tokens", 0)
             turn_log["interactions"].append(
                 {"agent": agent["name"], "prompt": prompt, "response": response}
             )
         conversation_log.append(turn_log)
         print("\n")
 
-    # Summarize results
-    print("--- Simulation Summary ---")
+    # Summarize results into one buffer and write it out in a single call
+    summary = io.StringIO()
+    summary.write("--- Simulation Summary ---\n")
     for turn_log in conversation_log:
-        print(f"Turn {turn_log['turn']}:")
+        summary.write(f"Turn {turn_log['turn']}:\n")
         for interaction in turn_log["interactions"]:
-            print(f"{interaction['agent']} -> {interaction['response']}")
-    print(f"Total token usage: {token_usage}")
+            summary.write(f"{interaction['agent']} -> {interaction['response']}\n")
+    summary.write(f"Total token usage: {token_usage}\n")
+    sys.stdout.write(summary.getvalue())
 
 
 # Run the simulation